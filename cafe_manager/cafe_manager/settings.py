@@ -161,6 +161,7 @@ REST_FRAMEWORK = {
     "DEFAULT_RENDERER_CLASSES": [
         "orders.api.renderers.CustomRenderer",
     ],
+    "EXCEPTION_HANDLER": "orders.api.exceptions.custom_exception_handler",
 }
 
 SWAGGER_SETTINGS = {
@@ -0,0 +1,73 @@
+import logging
+
+from rest_framework import status
+from rest_framework.response import Response
+from rest_framework.views import exception_handler
+
+from orders.services import ConstraintError, OrderServiceError, SearchError
+
+logger = logging.getLogger(__name__)
+
+
+def custom_exception_handler(exc: Exception, context: dict) -> Response:
+    """
+    DRF exception handler that turns service errors into 404/400 responses.
+
+    Views let SearchError and ConstraintError propagate instead of wrapping every
+    method in a try/except decorator; anything else falls back to DRF's handler.
+
+    Args:
+        exc (Exception): The exception raised by the view.
+        context (dict): DRF handler context, including the view.
+
+    Returns:
+        Response: The error response, or None if DRF does not handle the exception either.
+    """
+    if isinstance(exc, (SearchError, ConstraintError)):
+        logger.debug(
+            "Error handled from %s: %s", type(context["view"]).__name__, str(exc)
+        )
+        if isinstance(exc, SearchError):
+            return not_found_error_response(exc)
+        return bad_request_error_response(exc)
+    return exception_handler(exc, context)
+
+
+def service_error_response(e: OrderServiceError, status_code: int) -> Response:
+    """
+    Returns an error response built from a service exception.
+
+    Args:
+        e (OrderServiceError): The exception containing error details.
+        status_code (int): The HTTP status code of the response.
+
+    Returns:
+        Response: A DRF Response object with the given status code.
+    """
+    return Response({"message": e.message, "details": e.details}, status=status_code)
+
+
+def not_found_error_response(e: OrderServiceError) -> Response:
+    """
+    Returns a 404 Not Found response with error details.
+
+    Args:
+        e (OrderServiceError): The exception containing error details.
+
+    Returns:
+        Response: A DRF Response object with a 404 status code.
+    """
+    return service_error_response(e, status.HTTP_404_NOT_FOUND)
+
+
+def bad_request_error_response(e: OrderServiceError) -> Response:
+    """
+    Returns a 400 Bad Request response with error details.
+
+    Args:
+        e (OrderServiceError): The exception containing error details.
+
+    Returns:
+        Response: A DRF Response object with a 400 status code.
+    """
+    return service_error_response(e, status.HTTP_400_BAD_REQUEST)
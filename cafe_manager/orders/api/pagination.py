@@ -0,0 +1,99 @@
+from math import ceil
+from typing import Any, Dict, List, Optional
+
+from django.db.models import Count, QuerySet, Window
+
+
+class KeysetPaginator:
+    """
+    Paginates an id-ordered order `.values()` queryset by the last seen id instead of OFFSET.
+
+    Fetching a page costs O(page_size) however deep the client is, and no COUNT(*) is issued.
+    """
+
+    def __init__(
+        self, queryset: QuerySet, page_size: int, cursor: Optional[int] = None
+    ):
+        """
+        Args:
+            queryset (QuerySet): Order rows to paginate, ordered by ascending id.
+            page_size (int): Number of orders per page.
+            cursor (Optional[int], optional): Id of the last order of the previous page. Defaults to None.
+        """
+        self.queryset = queryset
+        self.page_size = page_size
+        self.cursor = cursor
+
+    def get_page(self) -> List[Dict[str, Any]]:
+        """
+        Fetches the order rows that follow the cursor.
+
+        Returns:
+            List[Dict[str, Any]]: At most page_size order rows. `next_cursor` is set afterwards.
+        """
+        queryset = self.queryset
+        if self.cursor is not None:
+            queryset = queryset.filter(id__gt=self.cursor)
+        # ? One extra row tells whether a next page exists without counting
+        orders = list(queryset[: self.page_size + 1])
+        has_next = len(orders) > self.page_size
+        orders = orders[: self.page_size]
+        self.next_cursor = orders[-1]["id"] if has_next else None
+        return orders
+
+
+class WindowCountPaginator:
+    """
+    Page-number paginator that reads the total count from the page query itself.
+
+    `COUNT(*) OVER ()` comes back with every row, so a non-empty page costs one query
+    instead of Paginator's separate COUNT(*) plus LIMIT/OFFSET. Page numbers are resolved
+    like Paginator.get_page: invalid ones give the first page, too large ones the last.
+    """
+
+    def __init__(self, queryset: QuerySet, page_size: int):
+        """
+        Args:
+            queryset (QuerySet): Order rows to paginate.
+            page_size (int): Number of orders per page.
+        """
+        self.queryset = queryset
+        self.page_size = int(page_size)
+        self.count = 0
+
+    def _fetch(self, number: int) -> List[Dict[str, Any]]:
+        offset = (number - 1) * self.page_size
+        return list(
+            self.queryset.annotate(total_count=Window(Count("id")))[
+                offset : offset + self.page_size
+            ]
+        )
+
+    def get_page(self, number: Any) -> List[Dict[str, Any]]:
+        """
+        Fetches a page of order rows and sets `count`.
+
+        Args:
+            number (Any): The requested page number, as passed by the client.
+
+        Returns:
+            List[Dict[str, Any]]: The order rows of the page.
+        """
+        try:
+            number = max(int(number), 1)
+        except (TypeError, ValueError):
+            number = 1
+
+        rows = self._fetch(number)
+        if rows:
+            self.count = rows[0]["total_count"]
+        else:
+            # ? Past the end (or nothing matched): count separately, then serve the last page
+            self.count = self.queryset.count()
+            last_page = max(ceil(self.count / self.page_size), 1)
+            if number > last_page and self.count:
+                rows = self._fetch(last_page)
+
+        for row in rows:
+            del row["total_count"]
+        return rows
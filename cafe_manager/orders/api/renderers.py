@@ -1,5 +1,10 @@
+import orjson
 from rest_framework import status
 from rest_framework.renderers import JSONRenderer
+from rest_framework.utils.encoders import JSONEncoder
+
+# ? Reuse DRF's fallbacks (Decimal -> float, lazy strings, etc.) for types orjson does not know
+_encode_default = JSONEncoder().default
 
 
 class CustomRenderer(JSONRenderer):
@@ -14,4 +19,9 @@ class CustomRenderer(JSONRenderer):
             "data": data if is_success else None,
             "error": data if not is_success else None,
         }
-        return super().render(response_data, accepted_media_type, renderer_context)
+        # ? Non-str keys come from ListField errors, e.g. {"dishes": {0: {...}}}
+        return orjson.dumps(
+            response_data,
+            default=_encode_default,
+            option=orjson.OPT_NON_STR_KEYS,
+        )
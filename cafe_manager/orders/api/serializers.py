@@ -1,3 +1,5 @@
+from typing import Any, Dict, Iterable
+
 from rest_framework import serializers
 
 from orders.models import Dish, Order, OrderDish
@@ -12,6 +14,7 @@ class OrderDishSerializer(serializers.ModelSerializer):
     class Meta:
         model = OrderDish
         fields = ["dish_id", "dish_name", "quantity", "price"]
+        read_only_fields = fields
 
 
 class AddDishSerializer(serializers.Serializer):
@@ -19,12 +22,6 @@ class AddDishSerializer(serializers.Serializer):
     quantity = serializers.IntegerField(min_value=1)
 
 
-class ListQueryParamsSerializer(serializers.Serializer):
-    table_number = serializers.IntegerField(min_value=1, required=False, default=None)
-    status = serializers.CharField(required=False, default=None)
-    id = serializers.IntegerField(min_value=1, required=False, default=None)
-
-
 class CreateOrderSerializer(serializers.Serializer):
     table_number = serializers.IntegerField(min_value=1)
     dishes = serializers.ListField(child=AddDishSerializer(), allow_empty=False)
@@ -40,7 +37,67 @@ class OrderSerializer(serializers.ModelSerializer):
     class Meta:
         model = Order
         fields = ["id", "table_number", "total_price", "dishes", "status"]
+        read_only_fields = fields
 
 
 class StatusSerializer(serializers.Serializer):
     status = serializers.CharField()
+
+
+def serialize_order_row(order: Order, dishes: Iterable[OrderDish]) -> dict:
+    """
+    Builds an OrderSerializer-compatible representation of an order without DRF field machinery.
+
+    Args:
+        order (Order): The order to serialize.
+        dishes (Iterable[OrderDish]): Order dishes annotated with `dish_name` and `price`
+            (see OrderService._custom_prefetch).
+
+    Returns:
+        dict: The order representation as produced by OrderSerializer.
+    """
+    return {
+        "id": order.id,
+        "table_number": order.table_number,
+        "total_price": str(order.total_price),
+        "dishes": [
+            {
+                "dish_id": order_dish.dish_id,
+                "dish_name": order_dish.dish_name,
+                "quantity": order_dish.quantity,
+                "price": str(order_dish.price),
+            }
+            for order_dish in dishes
+        ],
+        "status": order.status,
+    }
+
+
+def serialize_order_values(
+    order: Dict[str, Any], dishes: Iterable[Dict[str, Any]]
+) -> dict:
+    """
+    Builds an OrderSerializer-compatible representation from `.values()` rows.
+
+    Args:
+        order (Dict[str, Any]): Order row (see OrderService.search_values_by_filters).
+        dishes (Iterable[Dict[str, Any]]): Dish rows of the order (see OrderService.dishes_values_by_order_ids).
+
+    Returns:
+        dict: The order representation as produced by OrderSerializer.
+    """
+    return {
+        "id": order["id"],
+        "table_number": order["table_number"],
+        "total_price": str(order["total_price"]),
+        "dishes": [
+            {
+                "dish_id": dish["dish_id"],
+                "dish_name": dish["dish_name"],
+                "quantity": dish["quantity"],
+                "price": str(dish["price"]),
+            }
+            for dish in dishes
+        ],
+        "status": order["status"],
+    }
@@ -2,6 +2,9 @@ from drf_yasg import openapi
 
 from .serializers import OrderSerializer
 
+# ? Built once and shared by every response that returns a single order
+_ORDER_EXAMPLE = OrderSerializer().data
+
 error_schema = openapi.Schema(
     type=openapi.TYPE_OBJECT,
     properties={
@@ -94,6 +97,46 @@ def success_response_schema(data_schema):
     )
 
 
+ORDER_LIST_PARAMETERS = [
+    openapi.Parameter(
+        "pagesize",
+        openapi.IN_QUERY,
+        description="Number of orders per page (10 by default, at most 200)",
+        type=openapi.TYPE_INTEGER,
+    ),
+    openapi.Parameter(
+        "page",
+        openapi.IN_QUERY,
+        description="Page number",
+        type=openapi.TYPE_INTEGER,
+    ),
+    openapi.Parameter(
+        "cursor",
+        openapi.IN_QUERY,
+        description="Id of the last order seen; switches to keyset pagination "
+        "(empty for the first page, `page` and `count` are then omitted)",
+        type=openapi.TYPE_INTEGER,
+    ),
+    openapi.Parameter(
+        "table_number",
+        openapi.IN_QUERY,
+        description="Filter by table number",
+        type=openapi.TYPE_INTEGER,
+    ),
+    openapi.Parameter(
+        "status",
+        openapi.IN_QUERY,
+        description="Filter by order status",
+        type=openapi.TYPE_STRING,
+    ),
+    openapi.Parameter(
+        "id",
+        openapi.IN_QUERY,
+        description="Filter by order ID",
+        type=openapi.TYPE_INTEGER,
+    ),
+]
+
 ORDER_LIST_RESPONSE = openapi.Response(
     "Successful order list retrieval",
     success_response_schema(
@@ -101,6 +144,11 @@ ORDER_LIST_RESPONSE = openapi.Response(
             type=openapi.TYPE_OBJECT,
             properties={
                 "count": openapi.Schema(type=openapi.TYPE_INTEGER, example=3),
+                "next_cursor": openapi.Schema(
+                    type=openapi.TYPE_INTEGER,
+                    x_nullable=True,
+                    description="Returned instead of count when paginating by cursor",
+                ),
                 "items": openapi.Schema(
                     type=openapi.TYPE_ARRAY,
                     items=openapi.Schema(
@@ -140,12 +188,12 @@ ORDER_LIST_RESPONSE = openapi.Response(
 
 ORDER_DETAIL_RESPONSE = openapi.Response(
     "Successful order retrieval",
-    success_response_schema(OrderSerializer().data),
+    success_response_schema(_ORDER_EXAMPLE),
 )
 
 ORDER_CREATE_RESPONSE = openapi.Response(
     "Order created successfully",
-    success_response_schema(OrderSerializer().data),
+    success_response_schema(_ORDER_EXAMPLE),
 )
 
 ORDER_DELETE_RESPONSE = openapi.Response(
@@ -155,7 +203,7 @@ ORDER_DELETE_RESPONSE = openapi.Response(
 
 ORDER_STATUS_UPDATE_RESPONSE = openapi.Response(
     "Order status updated successfully",
-    success_response_schema(OrderSerializer().data),
+    success_response_schema(_ORDER_EXAMPLE),
 )
 
 REVENUE_RESPONSE = openapi.Response(
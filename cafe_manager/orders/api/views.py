@@ -1,8 +1,7 @@
 import logging
-from functools import wraps
-from typing import Callable
+from typing import Any, Dict, Iterable, List, Optional, Tuple
 
-from django.core.paginator import Paginator
+from django.http import HttpResponse, QueryDict
 from drf_yasg import openapi
 from drf_yasg.utils import swagger_auto_schema
 from rest_framework import status
@@ -10,159 +9,124 @@ from rest_framework.request import Request
 from rest_framework.response import Response
 from rest_framework.views import APIView
 
-from orders.services import (ConstraintError, OrderService, OrderServiceError,
-                             SearchError)
+from orders.services import OrderService
 
-from .serializers import (CreateOrderSerializer, ListQueryParamsSerializer,
-                          OrderSerializer, StatusSerializer,
-                          WrappedDishSerializer)
+from .pagination import KeysetPaginator, WindowCountPaginator
+from .serializers import (CreateOrderSerializer, OrderSerializer,
+                          StatusSerializer, WrappedDishSerializer,
+                          serialize_order_row, serialize_order_values)
 from .swagger_schemas import (BAD_REQUEST_RESPONSE, NOT_FOUND_RESPONSE,
                               ORDER_CREATE_RESPONSE, ORDER_DELETE_RESPONSE,
-                              ORDER_DETAIL_RESPONSE, ORDER_LIST_RESPONSE,
+                              ORDER_DETAIL_RESPONSE, ORDER_LIST_PARAMETERS,
+                              ORDER_LIST_RESPONSE,
                               ORDER_STATUS_UPDATE_RESPONSE, REVENUE_RESPONSE,
                               VALIDATION_ERROR_RESPONSE)
 
 logger = logging.getLogger(__name__)
 
+DEFAULT_PAGE_SIZE = 10
+MAX_PAGE_SIZE = 200
 
-def protective_call(
-    error_handler: Callable[[Exception], any], *errors_to_except: Exception
-):
-    """
-    A decorator factory to handle specific exceptions and return a custom error response.
-
-    Args:
-        error_handler (Callable[[Exception], any]): A function to handle the exception.
-        *errors_to_except (Exception): Variable list of exceptions to catch.
-
-    Returns:
-        Callable: A decorator that wraps the function and handles specified exceptions.
-    """
 
-    def decorator(func: Callable):
-        @wraps(func)
-        def wrapper(*args, **kwargs):
-            try:
-                return func(*args, **kwargs)
-            except errors_to_except as e:
-                logger.debug("Error handled from %s: %s", func.__name__, str(e))
-                return error_handler(e)
+# * Error bodies share one shape; fill a copy of the template instead of rebuilding it
+_VALIDATION_ERROR_TEMPLATE = {"message": "Data validation error.", "details": None}
 
-        return wrapper
 
-    return decorator
-
-
-def handle_service_search_error(wrapper):
+def validation_error_response(errors: Dict[str, List[str]]) -> Response:
     """
-    Decorator to handle SearchError exceptions and return a 404 response.
+    Returns a 422 Unprocessable Entity response with validation error details.
 
     Args:
-        wrapper: The function to wrap.
+        errors (Dict[str, List[str]]): Validation errors by field name, e.g. serializer.errors.
 
     Returns:
-        Callable: A decorated function that handles SearchError.
+        Response: A DRF Response object with a 422 status code.
     """
-    return protective_call(not_found_error_response, SearchError)(wrapper)
+    response_data = _VALIDATION_ERROR_TEMPLATE.copy()
+    response_data["details"] = errors
+    return Response(response_data, status=status.HTTP_422_UNPROCESSABLE_ENTITY)
 
 
-def handle_service_constraint_error(wrapper):
+def parse_list_query_params(
+    query_params: QueryDict,
+) -> Tuple[Dict[str, Optional[Any]], Dict[str, List[str]]]:
     """
-    Decorator to handle ConstraintError exceptions and return a 400 response.
+    Parses order list filters from query parameters without a DRF serializer.
 
     Args:
-        wrapper: The function to wrap.
+        query_params (QueryDict): The request query parameters.
 
     Returns:
-        Callable: A decorated function that handles ConstraintError.
+        Tuple[Dict[str, Optional[Any]], Dict[str, List[str]]]: Parsed filters (None for missing ones)
+        and validation errors by parameter name, in DRF's error format.
     """
-    return protective_call(bad_request_error_response, ConstraintError)(wrapper)
-
-
-def not_found_error_response(e: OrderServiceError) -> Response:
+    filters = {"status": query_params.get("status") or None}
+    errors = {}
+    for name in ("table_number", "id"):
+        filters[name] = parse_positive_int(query_params, name, errors)
+    return filters, errors
+
+
+def parse_positive_int(
+    query_params: QueryDict,
+    name: str,
+    errors: Dict[str, List[str]],
+    max_value: Optional[int] = None,
+) -> Optional[int]:
     """
-    Returns a 404 Not Found response with error details.
+    Parses an optional positive integer query parameter.
 
     Args:
-        e (OrderServiceError): The exception containing error details.
+        query_params (QueryDict): The request query parameters.
+        name (str): The parameter name.
+        errors (Dict[str, List[str]]): Collected validation errors, extended in place on failure.
+        max_value (Optional[int], optional): Upper bound of the value. Defaults to None.
 
     Returns:
-        Response: A DRF Response object with a 404 status code.
+        Optional[int]: The parsed value, or None if the parameter is missing, empty or invalid.
     """
-    return Response(
-        {"message": e.message, "details": e.details},
-        status=status.HTTP_404_NOT_FOUND,
-    )
-
-
-def bad_request_error_response(e: OrderServiceError) -> Response:
+    raw_value = query_params.get(name)
+    if not raw_value:
+        return None
+    try:
+        value = int(raw_value)
+    except ValueError:
+        errors[name] = ["A valid integer is required."]
+        return None
+    if value < 1:
+        errors[name] = ["Ensure this value is greater than or equal to 1."]
+        return None
+    if max_value is not None and value > max_value:
+        errors[name] = [f"Ensure this value is less than or equal to {max_value}."]
+        return None
+    return value
+
+
+def serialize_order_values_page(order_rows: Iterable[Dict[str, Any]]) -> List[dict]:
     """
-    Returns a 400 Bad Request response with error details.
+    Serializes a page of order rows, fetching all of their dishes in one query.
 
     Args:
-        e (OrderServiceError): The exception containing error details.
+        order_rows (Iterable[Dict[str, Any]]): Order rows from OrderService.search_values_by_filters.
 
     Returns:
-        Response: A DRF Response object with a 400 status code.
+        List[dict]: OrderSerializer-compatible representations of the orders.
     """
-    return Response(
-        {"message": e.message, "details": e.details},
-        status=status.HTTP_400_BAD_REQUEST,
-    )
-
-
-def validation_error_response(serializer) -> Response:
-    """
-    Returns a 422 Unprocessable Entity response with validation error details.
-
-    Args:
-        serializer: The serializer containing validation errors.
-
-    Returns:
-        Response: A DRF Response object with a 422 status code.
-    """
-    return Response(
-        {"message": "Data validation error.", "details": serializer.errors},
-        status=status.HTTP_422_UNPROCESSABLE_ENTITY,
+    order_rows = list(order_rows)
+    dishes_by_order = OrderService.dishes_values_by_order_ids(
+        [order["id"] for order in order_rows]
     )
+    return [
+        serialize_order_values(order, dishes_by_order[order["id"]])
+        for order in order_rows
+    ]
 
 
 class OrderView(APIView):
 
     @swagger_auto_schema(
         operation_description="Retrieve a paginated list of orders.",
-        manual_parameters=[
-            openapi.Parameter(
-                "pagesize",
-                openapi.IN_QUERY,
-                description="Number of orders per page",
-                type=openapi.TYPE_INTEGER,
-            ),
-            openapi.Parameter(
-                "page",
-                openapi.IN_QUERY,
-                description="Page number",
-                type=openapi.TYPE_INTEGER,
-            ),
-            openapi.Parameter(
-                "table_number",
-                openapi.IN_QUERY,
-                description="Filter by table number",
-                type=openapi.TYPE_INTEGER,
-            ),
-            openapi.Parameter(
-                "status",
-                openapi.IN_QUERY,
-                description="Filter by order status",
-                type=openapi.TYPE_STRING,
-            ),
-            openapi.Parameter(
-                "id",
-                openapi.IN_QUERY,
-                description="Filter by order ID",
-                type=openapi.TYPE_INTEGER,
-            ),
-        ],
+        manual_parameters=ORDER_LIST_PARAMETERS,
         responses={
             200: ORDER_LIST_RESPONSE,
             422: VALIDATION_ERROR_RESPONSE,
@@ -178,23 +142,40 @@ class OrderView(APIView):
         Returns:
             Response: A DRF Response object containing the paginated list of orders.
         """
-        serializer = ListQueryParamsSerializer(data=request.query_params)
-        if not serializer.is_valid():
-            logger.debug("Validation error in OrderView GET: %s", serializer.errors)
-            return validation_error_response(serializer)
-
-        orders = OrderService.search_by_filters(
-            **serializer.validated_data, normalized=True
+        filters, errors = parse_list_query_params(request.query_params)
+        page_size = (
+            parse_positive_int(
+                request.query_params, "pagesize", errors, max_value=MAX_PAGE_SIZE
+            )
+            or DEFAULT_PAGE_SIZE
         )
+        page_number = parse_positive_int(request.query_params, "page", errors) or 1
+        keyset_mode = "cursor" in request.query_params
+        if keyset_mode:
+            cursor = parse_positive_int(request.query_params, "cursor", errors)
+        if errors:
+            logger.debug("Validation error in OrderView GET: %s", errors)
+            return validation_error_response(errors)
+
+        # ? Rows stay plain dicts from the DB to the renderer, no model instances
+        orders = OrderService.search_values_by_filters(**filters, normalized=True)
+
+        if keyset_mode:
+            paginator = KeysetPaginator(orders, page_size, cursor)
+            serialized_orders = serialize_order_values_page(paginator.get_page())
+            logger.info(
+                "Retrieved %d orders after cursor %s", len(serialized_orders), cursor
+            )
+            return Response(
+                {"next_cursor": paginator.next_cursor, "items": serialized_orders},
+                status=status.HTTP_200_OK,
+            )
 
-        page_size = request.query_params.get("pagesize", 10)
-        page_number = request.query_params.get("page", 1)
-
-        paginator = Paginator(orders, page_size)
+        paginator = WindowCountPaginator(orders, page_size)
 
         page = paginator.get_page(page_number)
 
-        serialized_orders = OrderSerializer(page, many=True).data
+        serialized_orders = serialize_order_values_page(page)
 
         logger.info(
             "Retrieved %d orders from page %d",
@@ -215,7 +196,6 @@ class OrderView(APIView):
             422: VALIDATION_ERROR_RESPONSE,
         },
     )
-    @handle_service_constraint_error
     def post(self, request: Request) -> Response:
         """
         Create a new order.
@@ -229,14 +209,17 @@ class OrderView(APIView):
         serializer = CreateOrderSerializer(data=request.data)
         if not serializer.is_valid():
             logger.debug("Validation error in OrderView POST: %s", serializer.errors)
-            return validation_error_response(serializer)
+            return validation_error_response(serializer.errors)
 
         table_number = serializer.validated_data["table_number"]
         dishes = serializer.validated_data["dishes"]
 
-        order = OrderService.create(table_number, dishes)
+        order = OrderService.prefetch_dishes(OrderService.create(table_number, dishes))
         logger.info("Created order with ID %d", order.pk)
-        return Response(OrderSerializer(order).data, status=status.HTTP_201_CREATED)
+        return Response(
+            serialize_order_row(order, order.prefetched_dishes),
+            status=status.HTTP_201_CREATED,
+        )
 
 
 class OrderIdView(APIView):
@@ -248,7 +231,6 @@ class OrderIdView(APIView):
             404: NOT_FOUND_RESPONSE,
         },
     )
-    @handle_service_search_error
     def get(self, _, order_id: int) -> Response:
         """
         Retrieve details of a specific order by its ID.
@@ -260,16 +242,18 @@ class OrderIdView(APIView):
         Returns:
             Response: A DRF Response object containing the order details.
         """
-        order = OrderService.search_by_id(order_id)
+        order = OrderService.search_by_id(order_id, apply_prefetch=True)
         logger.info("Retrieved order with ID %d", order_id)
-        return Response(OrderSerializer(order).data, status=status.HTTP_200_OK)
+        return Response(
+            serialize_order_row(order, order.prefetched_dishes),
+            status=status.HTTP_200_OK,
+        )
 
     @swagger_auto_schema(
         operation_description="Delete an order.",
         responses={204: ORDER_DELETE_RESPONSE, 404: NOT_FOUND_RESPONSE},
     )
-    @handle_service_search_error
-    def delete(self, _, order_id: int) -> Response:
+    def delete(self, _, order_id: int) -> HttpResponse:
         """
         Delete a specific order by its ID.
 
@@ -278,11 +262,12 @@ class OrderIdView(APIView):
             order_id (int): The ID of the order to delete.
 
         Returns:
-            Response: A DRF Response object with a 204 No Content status.
+            HttpResponse: An empty response with a 204 No Content status.
         """
         OrderService.remove_by_id(order_id)
         logger.info("Deleted order with ID %d", order_id)
-        return Response(status=status.HTTP_204_NO_CONTENT)
+        # ? Nothing to negotiate or render for an empty body
+        return HttpResponse(status=status.HTTP_204_NO_CONTENT)
 
 
 class OrderIdStatusView(APIView):
@@ -297,8 +282,6 @@ class OrderIdStatusView(APIView):
             422: VALIDATION_ERROR_RESPONSE,
         },
     )
-    @handle_service_search_error
-    @handle_service_constraint_error
     def patch(self, request: Request, order_id: int) -> Response:
         """
         Update the status of a specific order by its ID.
@@ -316,13 +299,18 @@ class OrderIdStatusView(APIView):
                 "Validation error in OrderIdStatusView PATCH: %s",
                 serializer.errors,
             )
-            return validation_error_response(serializer)
+            return validation_error_response(serializer.errors)
 
         new_status = serializer.validated_data["status"]
-        order = OrderService.modify_status_by_id(order_id, new_status)
+        order = OrderService.modify_status_by_id(
+            order_id, new_status, apply_prefetch=True
+        )
 
         logger.info("Updated status of order %d to %s", order_id, new_status)
-        return Response(OrderSerializer(order).data, status=status.HTTP_200_OK)
+        return Response(
+            serialize_order_row(order, order.prefetched_dishes),
+            status=status.HTTP_200_OK,
+        )
 
 
 class OrderIdDishesView(APIView):
@@ -337,8 +325,6 @@ class OrderIdDishesView(APIView):
             422: VALIDATION_ERROR_RESPONSE,
         },
     )
-    @handle_service_search_error
-    @handle_service_constraint_error
     def patch(self, request: Request, order_id: int) -> Response:
         """
         Update the dishes of a specific order by its ID.
@@ -356,13 +342,19 @@ class OrderIdDishesView(APIView):
                 "Validation error in OrderIdDishesView PATCH: %s",
                 serializer.errors,
             )
-            return validation_error_response(serializer)
+            return validation_error_response(serializer.errors)
 
         new_dishes = serializer.validated_data["dishes"]
-        order = OrderService.modify_dishes_by_id(order_id, new_dishes)
+        # ? Prefetch after the update, the dishes are replaced by it
+        order = OrderService.prefetch_dishes(
+            OrderService.modify_dishes_by_id(order_id, new_dishes)
+        )
 
         logger.info("Updated dishes of order %d", order_id)
-        return Response(OrderSerializer(order).data, status=status.HTTP_200_OK)
+        return Response(
+            serialize_order_row(order, order.prefetched_dishes),
+            status=status.HTTP_200_OK,
+        )
 
 
 class RevenueView(APIView):
@@ -0,0 +1,21 @@
+# Generated by Django 5.1.15 on 2026-10-15 21:55
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("orders", "0005_remove_dish_amount"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="order",
+            index=models.Index(
+                condition=models.Q(("status", "paid")),
+                fields=["total_price"],
+                name="orders_paid_total",
+            ),
+        ),
+    ]
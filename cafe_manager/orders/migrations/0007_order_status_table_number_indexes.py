@@ -0,0 +1,21 @@
+# Generated by Django 5.1.15 on 2026-10-15 21:57
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("orders", "0006_order_orders_paid_total"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="order",
+            index=models.Index(fields=["status", "id"], name="orders_status_id"),
+        ),
+        migrations.AddIndex(
+            model_name="order",
+            index=models.Index(fields=["table_number"], name="orders_table_number"),
+        ),
+    ]
@@ -0,0 +1,20 @@
+# Generated by Django 5.1.15 on 2026-10-15 22:01
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("orders", "0007_order_status_table_number_indexes"),
+    ]
+
+    operations = [
+        migrations.AddConstraint(
+            model_name="order",
+            constraint=models.CheckConstraint(
+                condition=models.Q(("table_number__gt", 0)),
+                name="orders_order_table_number_positive",
+            ),
+        ),
+    ]
@@ -1,8 +1,10 @@
 import decimal
-from typing import Dict, List
+from typing import Any, Dict, List
 
 from django.core.exceptions import ValidationError
 from django.db import models, transaction
+from django.db.models import F, Sum
+from django.db.models.functions import Coalesce
 from django.utils.translation import gettext_lazy as _
 
 
@@ -16,11 +18,6 @@ class OrderStatus(models.TextChoices):
     STATUS_READY = "ready", _("Готово")
     STATUS_PAID = "paid", _("Оплачено")
 
-    @staticmethod
-    def verify_status(status: str):
-        if not status in [choice[0] for choice in OrderStatus.choices]:
-            raise ValidationError("Status not allowed:")
-
 
 class Order(models.Model):
     table_number: int = models.IntegerField()
@@ -37,36 +34,136 @@ class Order(models.Model):
     class Meta:
         constraints = [
             models.CheckConstraint(
-                condition=models.Q(
-                    status__in=[choice[0] for choice in OrderStatus.choices]
-                ),
+                condition=models.Q(status__in=OrderStatus.values),
                 name="%(app_label)s_%(class)s_status_valid",
-            )
+            ),
+            models.CheckConstraint(
+                condition=models.Q(table_number__gt=0),
+                name="%(app_label)s_%(class)s_table_number_positive",
+            ),
+        ]
+        indexes = [
+            # ? (status, id) serves status filters ordered/paged by id, e.g. keyset pages
+            models.Index(fields=["status", "id"], name="orders_status_id"),
+            models.Index(fields=["table_number"], name="orders_table_number"),
+            # ? Lets the revenue SUM over paid orders read only the index
+            models.Index(
+                fields=["total_price"],
+                condition=models.Q(status=OrderStatus.STATUS_PAID),
+                name="orders_paid_total",
+            ),
         ]
 
     def validate_table_number(self):
         """Checks whether table_number is convertable and/or represented as a positive integer."""
         try:
-            # ! bad validation
-            assert int(self.table_number) > 0
-        except (ValueError, AssertionError) as e:
+            table_number = int(self.table_number)
+        except (TypeError, ValueError) as e:
             raise ValidationError(
                 "Bad table_number: should be a positive integer"
             ) from e
+        # ? Explicit check, an assert would be stripped under python -O
+        if table_number <= 0:
+            raise ValidationError("Bad table_number: should be a positive integer")
 
     def calculate_total_price(self):
         """Calculate total price."""
-        total = decimal.Decimal(0)
-        for order_dish in self.order_dishes.all():
-            total += order_dish.dish.price * order_dish.quantity
-        return total
+        # * Summed by the database in one query instead of loading every dish
+        total = self.order_dishes.aggregate(
+            total=Coalesce(
+                Sum(
+                    F("dish__price") * F("quantity"),
+                    output_field=models.DecimalField(max_digits=12, decimal_places=2),
+                ),
+                decimal.Decimal(0),
+                output_field=models.DecimalField(max_digits=12, decimal_places=2),
+            )
+        )["total"]
+        # ? SQLite computes the product as a float, round it back to the field's precision
+        return total.quantize(decimal.Decimal("0.01"))
 
     def save(self, *args, **kwargs):
         """Saves an order."""
         self.validate_table_number()
-        OrderStatus.verify_status(self.status)
+        # ? Status values are enforced by the CheckConstraint, see Meta.constraints
         super().save(*args, **kwargs)
 
+    @staticmethod
+    def verify_dishes(
+        *dishes_lists: List[Dict[str, int]]
+    ) -> Dict[int, decimal.Decimal]:
+        """
+        Checks that every list is non-empty and refers to existing dishes only.
+
+        Args:
+            *dishes_lists (List[Dict[str, int]]): Lists of dictionaries containing dish IDs and quantities.
+
+        Returns:
+            Dict[int, decimal.Decimal]: Prices of the referenced dishes by dish ID.
+
+        Raises:
+            ValidationError: If a list is empty, lacks a dish ID or refers to a missing dish.
+        """
+        try:
+            dish_ids = [
+                dish_data["dish_id"] for dishes in dishes_lists for dish_data in dishes
+            ]
+        except KeyError as e:
+            raise ValidationError(
+                "Dish validation failed: missing dish_id field"
+            ) from e
+        if not all(dishes_lists):
+            raise ValidationError("Dish validation failed: dishes can not be empty")
+        # * One lookup for all dishes instead of a get() per dish
+        prices = dict(Dish.objects.filter(id__in=dish_ids).values_list("id", "price"))
+        for dish_id in dish_ids:
+            if dish_id not in prices:
+                raise ValidationError(
+                    f"Dish validation failed: dish id [{dish_id}] does not exist"
+                )
+        return prices
+
+    @staticmethod
+    def dishes_total(
+        dishes: List[Dict[str, int]], prices: Dict[int, decimal.Decimal]
+    ) -> decimal.Decimal:
+        """
+        Sums dish prices times quantities without querying the database.
+
+        Args:
+            dishes (List[Dict[str, int]]): A list of dictionaries containing dish IDs and quantities.
+            prices (Dict[int, decimal.Decimal]): Dish prices by dish ID, as returned by verify_dishes.
+
+        Returns:
+            decimal.Decimal: The total price of the dishes.
+        """
+        return sum(
+            (
+                prices[dish_data["dish_id"]] * dish_data.get("quantity", 1)
+                for dish_data in dishes
+            ),
+            decimal.Decimal(0),
+        )
+
+    def add_dishes(self, dishes: List[Dict[str, int]]):
+        """
+        Inserts verified dishes of the order with one multi-row INSERT.
+
+        Args:
+            dishes (List[Dict[str, int]]): A list of dictionaries containing dish IDs and quantities.
+        """
+        OrderDish.objects.bulk_create(
+            [
+                OrderDish(
+                    order=self,
+                    dish_id=dish_data["dish_id"],
+                    quantity=dish_data.get("quantity", 1),
+                )
+                for dish_data in dishes
+            ],
+            batch_size=500,
+        )
+
     def update_dishes(self, new_dishes: List[Dict[str, int]]):
         """
         Updates the dishes in the order.
@@ -77,29 +174,17 @@ class Order(models.Model):
         Raises:
             ValidationError: If a dish ID is invalid or validation fails.
         """
-        if len(new_dishes) == 0:
-            raise ValidationError("Dish validation failed: dishes can not be empty")
+        prices = Order.verify_dishes(new_dishes)
         with transaction.atomic():
+            # ? Row lock serializes concurrent dish updates of the same order; the validation
+            # ? queries above stay outside the transaction to keep it short
+            Order.objects.select_for_update().filter(pk=self.pk).exists()
             self.dishes.clear()
-            for dish_data in new_dishes:
-                try:
-                    dish_id = dish_data["dish_id"]
-                    dish = Dish.objects.get(id=dish_id)
-                except Dish.DoesNotExist as e:
-                    raise ValidationError(
-                        f"Dish validation failed: dish id [{dish_id}] does not exist"
-                    ) from e
-                except ValueError as e:
-                    raise ValidationError(
-                        "Dish validation failed: missing dish_id field"
-                    ) from e
-                OrderDish.objects.create(
-                    order=self,
-                    dish=dish,
-                    quantity=dish_data.get("quantity", 1),
-                )
-            self.total_price = self.calculate_total_price()
-            self.save(update_fields=["total_price"])
+            self.add_dishes(new_dishes)
+            # * Prices are already loaded by verify_dishes, no need to re-read the new rows
+            self.total_price = Order.dishes_total(new_dishes, prices)
+            # ? Plain UPDATE: nothing validated in save() changes here
+            Order.objects.filter(pk=self.pk).update(total_price=self.total_price)
 
     @classmethod
     def create_order(cls, table_number: int, dishes: List[Dict[str, int]]):
@@ -116,12 +201,57 @@ class Order(models.Model):
         Raises:
             ValidationError: If a dish ID is invalid or validation fails.
         """
+        order = cls(table_number=table_number)
+        order.validate_table_number()
+        prices = Order.verify_dishes(dishes)
+        # * Total is known up front: one INSERT for the order, one for its dishes
+        order.total_price = Order.dishes_total(dishes, prices)
         with transaction.atomic():
-            order = cls(table_number=table_number)
             order.save()
-            order.update_dishes(dishes)
+            order.add_dishes(dishes)
         return order
 
+    @classmethod
+    def create_orders(cls, orders_data: List[Dict[str, Any]]) -> List["Order"]:
+        """
+        Creates several orders and their dishes with batched queries.
+
+        Args:
+            orders_data (List[Dict[str, Any]]): Dictionaries with `table_number` and `dishes`,
+                as accepted by create_order.
+
+        Returns:
+            List[Order]: The newly created orders, in input order.
+
+        Raises:
+            ValidationError: If a table number or dish ID is invalid or validation fails.
+        """
+        prices = Order.verify_dishes(
+            *(order_data["dishes"] for order_data in orders_data)
+        )
+        orders = []
+        for order_data in orders_data:
+            order = cls(table_number=order_data["table_number"])
+            order.validate_table_number()
+            order.total_price = Order.dishes_total(order_data["dishes"], prices)
+            orders.append(order)
+
+        with transaction.atomic():
+            cls.objects.bulk_create(orders, batch_size=1000)
+            OrderDish.objects.bulk_create(
+                [
+                    OrderDish(
+                        order=order,
+                        dish_id=dish_data["dish_id"],
+                        quantity=dish_data.get("quantity", 1),
+                    )
+                    for order, order_data in zip(orders, orders_data)
+                    for dish_data in order_data["dishes"]
+                ],
+                batch_size=1000,
+            )
+        return orders
+
 
 class OrderDish(models.Model):
     order = models.ForeignKey(
@@ -2,7 +2,9 @@ import decimal
 from typing import Dict, List, Optional
 
 from django.core.exceptions import ValidationError
-from django.db.models import F, Prefetch, Sum
+from django.db.models import (DecimalField, F, Prefetch, QuerySet, Sum, Value,
+                              prefetch_related_objects)
+from django.db.models.functions import Coalesce
 
 from orders.models import Dish, Order, OrderDish, OrderStatus
 
@@ -23,6 +25,13 @@ class ConstraintError(OrderServiceError):
     """Raised when a validation or constraint fails, such as invalid data or dish IDs."""
 
 
+_PRICE_FIELD = DecimalField(max_digits=12, decimal_places=2)
+_ZERO_PRICE = Value(decimal.Decimal(0), output_field=_PRICE_FIELD)
+
+# ? Built once; OrderStatus.values rebuilds its list on every access
+_ALLOWED_STATUSES = frozenset(OrderStatus.values)
+
+
 class OrderService:
     """Service class for managing orders, including creation, modification, and retrieval."""
 
@@ -35,13 +44,27 @@ class OrderService:
         """
         return Prefetch(
             "order_dishes",
-            queryset=OrderDish.objects.select_related("dish").annotate(
+            # ? Dish columns come in through the annotations' JOIN, no need to select_related them
+            queryset=OrderDish.objects.only("order_id", "dish_id", "quantity").annotate(
                 dish_name=F("dish__name"),
                 price=F("dish__price"),
             ),
             to_attr="prefetched_dishes",
         )
 
+    @staticmethod
+    def prefetch_dishes(order: Order) -> Order:
+        """Loads the dishes of an already fetched order the same way apply_prefetch does.
+
+        Args:
+            order (Order): The order, e.g. one just created or modified.
+
+        Returns:
+            Order: The same order with `prefetched_dishes` populated.
+        """
+        prefetch_related_objects([order], OrderService._custom_prefetch())
+        return order
+
     @staticmethod
     def _get_and_verify_unique_existance(
         apply_prefetch: bool = False, **fields
@@ -96,6 +119,25 @@ class OrderService:
                 str(e), {"table_number": table_number, "dishes": dishes}
             ) from e
 
+    @staticmethod
+    def bulk_create(orders_data: List[Dict[str, any]]) -> List[Order]:
+        """
+        Creates several orders at once, e.g. a batch from a POS terminal.
+
+        Args:
+            orders_data (List[Dict[str, any]]): Dictionaries with `table_number` and `dishes` (see create).
+
+        Returns:
+            List[Order]: The newly created orders.
+
+        Raises:
+            ConstraintError: If a table number or dish ID is invalid or validation fails.
+        """
+        try:
+            return Order.create_orders(orders_data)
+        except ValidationError as e:
+            raise ConstraintError(str(e), {"orders": orders_data}) from e
+
     @staticmethod
     def search_by_id(order_id: int, apply_prefetch: bool = False) -> Order:
         """Retrieves an order by its unique ID.
@@ -131,7 +173,9 @@ class OrderService:
             List[Order]: A list of orders matching the filters.
         """
         provided_filters = (
-            {key: val for key, val in filters.items() if val} if normalized else filters
+            {key: val for key, val in filters.items() if val is not None}
+            if normalized
+            else filters
         )
         ordered_filtered_objects = Order.objects.filter(**provided_filters).order_by(
             "id"
@@ -143,6 +187,51 @@ class OrderService:
             else ordered_filtered_objects
         )
 
+    @staticmethod
+    def search_values_by_filters(
+        normalized: bool = False, **filters: Dict[str, Optional[any]]
+    ) -> QuerySet:
+        """Searches for orders like search_by_filters, but as plain dicts of the order columns.
+
+        Args:
+            normalized (bool, optional): If True, excludes None-valued keys from filters. Defaults to False.
+            **filters: Filters to apply when searching for orders.
+
+        Returns:
+            QuerySet: Dicts with id, table_number, total_price and status, ordered by id.
+        """
+        return OrderService.search_by_filters(normalized=normalized, **filters).values(
+            "id", "table_number", "total_price", "status"
+        )
+
+    @staticmethod
+    def dishes_values_by_order_ids(
+        order_ids: List[int],
+    ) -> Dict[int, List[Dict[str, any]]]:
+        """Fetches the dishes of several orders in one query, grouped by order ID.
+
+        Args:
+            order_ids (List[int]): The IDs of the orders.
+
+        Returns:
+            Dict[int, List[Dict[str, any]]]: Dicts with dish_id, quantity, dish_name and price for every order ID.
+        """
+        dishes_by_order = {order_id: [] for order_id in order_ids}
+        dish_rows = (
+            OrderDish.objects.filter(order_id__in=order_ids)
+            .order_by("id")
+            .values(
+                "order_id",
+                "dish_id",
+                "quantity",
+                dish_name=F("dish__name"),
+                price=F("dish__price"),
+            )
+        )
+        for dish_row in dish_rows:
+            dishes_by_order[dish_row.pop("order_id")].append(dish_row)
+        return dishes_by_order
+
     @staticmethod
     def remove_by_id(order_id: int) -> int:
         """Deletes an order by its ID.
@@ -156,8 +245,12 @@ class OrderService:
         Raises:
             SearchError: If no order is found with the provided ID.
         """
-        order = OrderService._get_and_verify_unique_existance(id=order_id)
-        return order.delete()[0]
+        deleted, _ = Order.objects.filter(id=order_id).delete()
+        if not deleted:
+            raise SearchError(
+                "No order found with the provided filters.", {"id": order_id}
+            )
+        return deleted
 
     @staticmethod
     def modify_status_by_id(
@@ -181,14 +274,35 @@ class OrderService:
             apply_prefetch=apply_prefetch, id=order_id
         )
 
-        try:
-            order.status = new_status
-            order.save(update_fields=["status"])
-        except ValidationError as e:
-            raise ConstraintError(str(e), {"status": new_status}) from e
+        if new_status not in _ALLOWED_STATUSES:
+            raise ConstraintError("Status not allowed", {"status": new_status})
 
+        order.status = new_status
+        order.save(update_fields=["status"])
         return order
 
+    @staticmethod
+    def set_status_by_id(order_id: int, new_status: str) -> None:
+        """Updates the status of an order with a single UPDATE, without loading it.
+
+        Use it when the caller does not need the updated order; see modify_status_by_id otherwise.
+
+        Args:
+            order_id (int): The ID of the order to update.
+            new_status (str): The new status to apply.
+
+        Raises:
+            SearchError: If no order is found with the provided ID.
+            ConstraintError: If the new status is invalid.
+        """
+        if new_status not in _ALLOWED_STATUSES:
+            raise ConstraintError("Status not allowed", {"status": new_status})
+
+        if not Order.objects.filter(id=order_id).update(status=new_status):
+            raise SearchError(
+                "No order found with the provided filters.", {"id": order_id}
+            )
+
     @staticmethod
     def modify_dishes_by_id(
         order_id: int,
@@ -229,11 +343,11 @@ class OrderService:
             decimal.Decimal: The total profit from paid orders.
         """
         paid_status = OrderStatus.STATUS_PAID
-        return (
-            Order.objects.filter(status=paid_status).aggregate(
-                total_profit=Sum("total_price")
-            )["total_profit"]
-        ) or decimal.Decimal(0)
+        return Order.objects.filter(status=paid_status).aggregate(
+            total_profit=Coalesce(
+                Sum("total_price"), _ZERO_PRICE, output_field=_PRICE_FIELD
+            )
+        )["total_profit"]
 
 
 class DishService:
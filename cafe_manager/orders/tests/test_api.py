@@ -4,6 +4,7 @@ from django.urls import reverse
 from rest_framework import status
 from rest_framework.test import APITestCase
 
+from orders.api.serializers import OrderSerializer
 from orders.models import OrderStatus
 from orders.services import OrderService
 
@@ -11,37 +12,43 @@ from orders.services import OrderService
 class OrderAPITestCase(APITestCase):
     fixtures = ["example_dishes.json"]
 
-    def setUp(self):
-        self.valid_order_data = {
-            "table_number": 5,
-            "dishes": [{"dish_id": 5, "quantity": 2}],
-        }
-
-        self.invalid_order_data = {
-            "table_number": -1,
-            "dishes": [],
-        }
-
-        self.order = OrderService.create(
-            self.valid_order_data["table_number"],
-            self.valid_order_data["dishes"],
-        )
-
-        self.order_detail_url = reverse("order-detail", args=[self.order.pk])
-        self.order_list_url = reverse("order-list")
-        self.order_status_url = reverse("order-status", args=[self.order.pk])
-        self.order_items_url = reverse("order-dishes", args=[self.order.pk])
+    # ? Plain class attributes: tests only read them, so no per-test deepcopy is needed
+    VALID_ORDER_DATA = {
+        "table_number": 5,
+        "dishes": [{"dish_id": 5, "quantity": 2}],
+    }
+
+    INVALID_ORDER_DATA = {
+        "table_number": -1,
+        "dishes": [],
+    }
+
+    @classmethod
+    def setUpTestData(cls):
+        # ? Created once per class; each test still runs in its own rolled back transaction
+        cls.order = OrderService.create(
+            cls.VALID_ORDER_DATA["table_number"],
+            cls.VALID_ORDER_DATA["dishes"],
+        )
+
+        cls.order_detail_url = reverse("order-detail", args=[cls.order.pk])
+        cls.order_list_url = reverse("order-list")
+        cls.order_status_url = reverse("order-status", args=[cls.order.pk])
+        cls.order_items_url = reverse("order-dishes", args=[cls.order.pk])
+        cls.revenue_url = reverse("order-revenue")
+        cls.missing_order_detail_url = reverse("order-detail", args=[999])
+        cls.missing_order_items_url = reverse("order-dishes", args=[999])
 
     def test_create_order_success(self):
         response = self.client.post(
-            self.order_list_url, self.valid_order_data, format="json"
+            self.order_list_url, self.VALID_ORDER_DATA, format="json"
         )
         self.assertEqual(response.status_code, status.HTTP_201_CREATED)
         self.assertIn("id", response.data)
 
     def test_create_order_with_empty_items_fails(self):
         response = self.client.post(
-            self.order_list_url, self.invalid_order_data, format="json"
+            self.order_list_url, self.INVALID_ORDER_DATA, format="json"
         )
         self.assertEqual(response.status_code, status.HTTP_422_UNPROCESSABLE_ENTITY)
 
@@ -51,7 +58,7 @@ class OrderAPITestCase(APITestCase):
         self.assertEqual(response.data["table_number"], self.order.table_number)
 
     def test_get_nonexistent_order_fails(self):
-        response = self.client.get(reverse("order-detail", args=[999]))
+        response = self.client.get(self.missing_order_detail_url)
         self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
 
     def test_update_order_status_success(self):
@@ -70,15 +77,16 @@ class OrderAPITestCase(APITestCase):
     def test_delete_order_success(self):
         response = self.client.delete(self.order_detail_url)
         self.assertEqual(response.status_code, status.HTTP_204_NO_CONTENT)
+        self.assertEqual(response.content, b"")
 
     def test_delete_nonexistent_order_fails(self):
-        response = self.client.delete(reverse("order-detail", args=[999]))
+        response = self.client.delete(self.missing_order_detail_url)
         self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
 
     def test_revenue_calculation(self):
         self.order.status = OrderStatus.STATUS_PAID
         self.order.save()
-        response = self.client.get(reverse("order-revenue"))
+        response = self.client.get(self.revenue_url)
         self.assertEqual(response.status_code, status.HTTP_200_OK)
         self.assertEqual(response.data["revenue"], self.order.total_price)
 
@@ -87,6 +95,72 @@ class OrderAPITestCase(APITestCase):
         self.assertEqual(response.status_code, status.HTTP_200_OK)
         self.assertIn("items", response.data)
 
+    def test_keyset_pagination(self):
+        second_order = OrderService.create(7, [{"dish_id": 1, "quantity": 1}])
+        response = self.client.get(self.order_list_url, {"cursor": "", "pagesize": 1})
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertNotIn("count", response.data)
+        self.assertEqual(response.data["items"][0]["id"], self.order.id)
+        self.assertEqual(response.data["next_cursor"], self.order.id)
+
+        response = self.client.get(
+            self.order_list_url,
+            {"cursor": response.data["next_cursor"], "pagesize": 1},
+        )
+        self.assertEqual(response.data["items"][0]["id"], second_order.id)
+        self.assertIsNone(response.data["next_cursor"])
+
+    def test_keyset_pagination_invalid_cursor_fails(self):
+        response = self.client.get(self.order_list_url, {"cursor": "abc"})
+        self.assertEqual(response.status_code, status.HTTP_422_UNPROCESSABLE_ENTITY)
+
+    def test_pagination_out_of_range_page_serves_last_page(self):
+        second_order = OrderService.create(7, [{"dish_id": 1, "quantity": 1}])
+        response = self.client.get(self.order_list_url, {"page": 5, "pagesize": 1})
+        self.assertEqual(response.data["count"], 2)
+        self.assertEqual(response.data["items"][0]["id"], second_order.id)
+
+    def test_pagination_invalid_params_fail(self):
+        response = self.client.get(self.order_list_url, {"page": "x", "pagesize": 201})
+        self.assertEqual(response.status_code, status.HTTP_422_UNPROCESSABLE_ENTITY)
+        self.assertEqual(set(response.data["details"]), {"page", "pagesize"})
+
+    def test_list_filters(self):
+        OrderService.create(7, [{"dish_id": 1, "quantity": 1}])
+        response = self.client.get(self.order_list_url, {"table_number": 7})
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data["count"], 1)
+        self.assertEqual(response.data["items"][0]["table_number"], 7)
+
+        response = self.client.get(self.order_list_url, {"id": "", "status": ""})
+        self.assertEqual(response.data["count"], 2)
+
+    def test_list_invalid_filters_fail(self):
+        response = self.client.get(
+            self.order_list_url, {"table_number": "two", "id": 0}
+        )
+        self.assertEqual(response.status_code, status.HTTP_422_UNPROCESSABLE_ENTITY)
+        self.assertEqual(set(response.data["details"]), {"table_number", "id"})
+
+    def test_list_items_match_order_serializer(self):
+        response = self.client.get(self.order_list_url)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data["items"], [OrderSerializer(self.order).data])
+
+    def test_list_query_count_does_not_grow_with_orders(self):
+        for table_number in range(1, 4):
+            OrderService.create(table_number, [{"dish_id": 1, "quantity": 1}])
+        # * page with its window count, order dishes
+        with self.assertNumQueries(2):
+            response = self.client.get(self.order_list_url)
+        self.assertEqual(len(response.data["items"]), 4)
+
+    def test_get_order_query_count(self):
+        # * order, order dishes prefetch
+        with self.assertNumQueries(2):
+            response = self.client.get(self.order_detail_url)
+        self.assertEqual(response.data, OrderSerializer(self.order).data)
+
     def test_update_order_items_success(self):
         new_dishes = [{"dish_id": 1, "quantity": 1}]
         response = self.client.patch(
@@ -105,6 +179,27 @@ class OrderAPITestCase(APITestCase):
             ],
         )
 
+    def test_write_responses_match_order_serializer(self):
+        response = self.client.patch(
+            self.order_items_url,
+            {"dishes": [{"dish_id": 1, "quantity": 1}, {"dish_id": 2, "quantity": 3}]},
+            format="json",
+        )
+        self.order.refresh_from_db()
+        self.assertEqual(response.data, OrderSerializer(self.order).data)
+
+        response = self.client.patch(
+            self.order_status_url, {"status": "ready"}, format="json"
+        )
+        self.order.refresh_from_db()
+        self.assertEqual(response.data, OrderSerializer(self.order).data)
+
+        response = self.client.post(
+            self.order_list_url, self.VALID_ORDER_DATA, format="json"
+        )
+        created_order = OrderService.search_by_id(response.data["id"])
+        self.assertEqual(response.data, OrderSerializer(created_order).data)
+
     def test_update_order_items_invalid_fails(self):
         response = self.client.patch(
             self.order_items_url, {"dishes": []}, format="json"
@@ -118,10 +213,19 @@ class OrderAPITestCase(APITestCase):
         )
         self.assertEqual(response.status_code, status.HTTP_422_UNPROCESSABLE_ENTITY)
 
+    def test_nested_validation_errors_are_rendered(self):
+        response = self.client.patch(
+            self.order_items_url,
+            {"dishes": [{"dish_id": 1, "quantity": 0}]},
+            format="json",
+        )
+        body = response.json()
+        self.assertFalse(body["success"])
+        self.assertIn("0", body["error"]["details"]["dishes"])
+
     def test_update_items_of_nonexistent_order_fails(self):
-        url = reverse("order-dishes", args=[999])
         response = self.client.patch(
-            url,
+            self.missing_order_items_url,
             {"dishes": [{"dish_id": 123, "quantity": 1}]},
             format="json",
         )
@@ -178,7 +282,7 @@ class OrderAPITestCase(APITestCase):
         """
         # * Step 1: Create an order
         create_response = self.client.post(
-            self.order_list_url, self.valid_order_data, format="json"
+            self.order_list_url, self.VALID_ORDER_DATA, format="json"
         )
         self.assertEqual(create_response.status_code, status.HTTP_201_CREATED)
         order_id = create_response.data["id"]
@@ -214,8 +318,7 @@ class OrderAPITestCase(APITestCase):
         self.assertEqual(update_status_response.data["status"], OrderStatus.STATUS_PAID)
 
         # * Step 5: Verify the revenue calculation
-        revenue_url = reverse("order-revenue")
-        revenue_response = self.client.get(revenue_url)
+        revenue_response = self.client.get(self.revenue_url)
         self.assertEqual(revenue_response.status_code, status.HTTP_200_OK)
 
         # * Fetch the order to get the updated total price
@@ -223,8 +326,7 @@ class OrderAPITestCase(APITestCase):
         order_detail_response = self.client.get(order_detail_url)
         self.assertEqual(order_detail_response.status_code, status.HTTP_200_OK)
         expected_revenue = decimal.Decimal(order_detail_response.data["total_price"])
-        # ? Decimal comparasion
-        self.assertAlmostEqual(revenue_response.data["revenue"], expected_revenue)
+        self.assertEqual(revenue_response.data["revenue"], expected_revenue)
 
         # * Step 6: Delete the order
         delete_response = self.client.delete(order_detail_url)
@@ -251,7 +353,7 @@ class OrderAPITestCase(APITestCase):
         """
         # * Step 1: Create an order with invalid data (should fail)
         invalid_create_response = self.client.post(
-            self.order_list_url, self.invalid_order_data, format="json"
+            self.order_list_url, self.INVALID_ORDER_DATA, format="json"
         )
         self.assertEqual(
             invalid_create_response.status_code,
@@ -260,7 +362,7 @@ class OrderAPITestCase(APITestCase):
 
         # * Step 2: Create an order with valid data (should succeed)
         valid_create_response = self.client.post(
-            self.order_list_url, self.valid_order_data, format="json"
+            self.order_list_url, self.VALID_ORDER_DATA, format="json"
         )
         self.assertEqual(valid_create_response.status_code, status.HTTP_201_CREATED)
         order_id = valid_create_response.data["id"]
@@ -303,8 +405,7 @@ class OrderAPITestCase(APITestCase):
         self.assertEqual(valid_status_response.data["status"], OrderStatus.STATUS_READY)
 
         # * Step 7: Attempt to delete a non-existent order (should fail)
-        non_existent_order_url = reverse("order-detail", args=[999])
-        delete_non_existent_response = self.client.delete(non_existent_order_url)
+        delete_non_existent_response = self.client.delete(self.missing_order_detail_url)
         self.assertEqual(
             delete_non_existent_response.status_code, status.HTTP_404_NOT_FOUND
         )
@@ -315,9 +416,6 @@ class OrderAPITestCase(APITestCase):
         self.assertEqual(delete_response.status_code, status.HTTP_204_NO_CONTENT)
 
         # * Step 9: Verify the revenue calculation after deleting the order (should still work)
-        revenue_url = reverse("order-revenue")
-        revenue_response = self.client.get(revenue_url)
+        revenue_response = self.client.get(self.revenue_url)
         self.assertEqual(revenue_response.status_code, status.HTTP_200_OK)
-        self.assertAlmostEqual(
-            revenue_response.data["revenue"], decimal.Decimal("0.00")
-        )
+        self.assertEqual(revenue_response.data["revenue"], decimal.Decimal("0.00"))
@@ -1,21 +1,43 @@
 from decimal import Decimal
 
+from django.db import connection
+from django.db.models import Count
 from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
 
 from orders.models import Dish, Order, OrderDish, OrderStatus
 from orders.services import (ConstraintError, OrderService, OrderServiceError,
                              SearchError)
 
 
+def _make_orders(*specs):
+    """Inserts orders built from keyword dicts with one bulk INSERT."""
+    return Order.objects.bulk_create([Order(**spec) for spec in specs])
+
+
 class OrderServiceTests(TestCase):
     fixtures = ["example_dishes.json"]
 
+    @classmethod
+    def setUpTestData(cls):
+        dishes = Dish.objects.in_bulk([1, 2])
+        cls.dish1 = dishes[1]  # Margherita Pizza (9.99)
+        cls.dish2 = dishes[2]  # Pepperoni Pizza (11.99)
+
+    def _assert_order(self, order_id, *, dishes, price):
+        """Checks the stored dish count and total price of an order in one query."""
+        stored = (
+            Order.objects.filter(pk=order_id)
+            .values("total_price")
+            .annotate(dish_count=Count("order_dishes"))
+            .get()
+        )
+        self.assertEqual(stored["dish_count"], dishes)
+        self.assertEqual(stored["total_price"], price)
+
     def test_create_order_success(self):
         """Test creating an order successfully."""
-        dish1 = Dish.objects.get(id=1)
-        dish2 = Dish.objects.get(id=2)
-
-        dishes = [{"dish_id": dish1.id}, {"dish_id": dish2.id}]
+        dishes = [{"dish_id": self.dish1.id}, {"dish_id": self.dish2.id}]
         order = OrderService.create(table_number=1, dishes=dishes)
 
         self.assertEqual(order.table_number, 1)
@@ -30,6 +52,45 @@ class OrderServiceTests(TestCase):
 
         self.assertIn("Dish validation failed: dish id", str(context.exception))
 
+    def test_create_order_query_count_does_not_grow_with_dishes(self):
+        """Test that creating an order costs the same number of queries for any dish count."""
+        dishes = [{"dish_id": dish_id, "quantity": 2} for dish_id in range(1, 6)]
+        # * dish prices, order, order dishes (+ savepoint, release)
+        with self.assertNumQueries(5):
+            order = OrderService.create(table_number=1, dishes=dishes)
+
+        self.assertEqual(order.order_dishes.count(), len(dishes))
+
+    def test_bulk_create_orders(self):
+        """Test creating several orders with a constant number of queries."""
+        orders_data = [
+            {"table_number": 1, "dishes": [{"dish_id": 1}, {"dish_id": 2}]},
+            {"table_number": 2, "dishes": [{"dish_id": 1, "quantity": 3}]},
+        ]
+        # * dish prices, orders, order dishes (+ savepoint, release)
+        with self.assertNumQueries(5):
+            orders = OrderService.bulk_create(orders_data)
+
+        for order, order_data in zip(orders, orders_data):
+            stored_order = Order.objects.get(id=order.id)
+            self.assertEqual(stored_order.table_number, order_data["table_number"])
+            self.assertEqual(stored_order.total_price, order.calculate_total_price())
+            self.assertEqual(
+                stored_order.order_dishes.count(), len(order_data["dishes"])
+            )
+        self.assertEqual(orders[0].total_price, Decimal("21.98"))
+
+    def test_bulk_create_orders_invalid_dish(self):
+        """Test that one invalid dish rejects the whole batch."""
+        with self.assertRaises(ConstraintError):
+            OrderService.bulk_create(
+                [
+                    {"table_number": 1, "dishes": [{"dish_id": 1}]},
+                    {"table_number": 2, "dishes": [{"dish_id": 999}]},
+                ]
+            )
+        self.assertFalse(Order.objects.exists())
+
     def test_search_by_id_success(self):
         """Test searching for an order by ID successfully."""
         order = Order.objects.create(table_number=1, status=OrderStatus.STATUS_PENDING)
@@ -49,8 +110,10 @@ class OrderServiceTests(TestCase):
 
     def test_search_by_filters_success(self):
         """Test searching for orders using filters."""
-        Order.objects.create(table_number=1, status=OrderStatus.STATUS_PENDING)
-        Order.objects.create(table_number=2, status=OrderStatus.STATUS_READY)
+        _make_orders(
+            {"table_number": 1, "status": OrderStatus.STATUS_PENDING},
+            {"table_number": 2, "status": OrderStatus.STATUS_READY},
+        )
 
         orders = OrderService.search_by_filters(table_number=1)
         self.assertEqual(len(orders), 1)
@@ -70,6 +133,55 @@ class OrderServiceTests(TestCase):
         self.assertEqual(len(orders), 1)
         self.assertEqual(orders[0].table_number, 1)
 
+        # * Only None means "not provided", falsy values still filter
+        orders = OrderService.search_by_filters(table_number=0, normalized=True)
+        self.assertEqual(len(orders), 0)
+
+    def test_search_by_filters_prefetch_query_count(self):
+        """Test that listing orders with their dishes costs two queries for any number of orders."""
+        for table_number in range(1, 4):
+            OrderService.create(
+                table_number=table_number,
+                dishes=[{"dish_id": self.dish1.id}, {"dish_id": self.dish2.id}],
+            )
+
+        # * Orders, then all their dishes with names and prices in one IN query
+        with self.assertNumQueries(2):
+            orders = OrderService.search_by_filters(apply_prefetch=True)
+            rendered = [
+                (dish.dish_name, dish.price, dish.quantity)
+                for order in orders
+                for dish in order.prefetched_dishes
+            ]
+        self.assertEqual(len(rendered), 6)
+
+    def test_dishes_values_by_order_ids(self):
+        """Test fetching dish rows of several orders grouped by order ID."""
+        order = OrderService.create(
+            table_number=1, dishes=[{"dish_id": 1, "quantity": 2}]
+        )
+        empty_order = Order.objects.create(table_number=2)
+
+        with self.assertNumQueries(1):
+            dishes_by_order = OrderService.dishes_values_by_order_ids(
+                [order.id, empty_order.id]
+            )
+
+        self.assertEqual(
+            dishes_by_order,
+            {
+                order.id: [
+                    {
+                        "dish_id": self.dish1.id,
+                        "quantity": 2,
+                        "dish_name": self.dish1.name,
+                        "price": self.dish1.price,
+                    }
+                ],
+                empty_order.id: [],
+            },
+        )
+
     def test_remove_by_id_success(self):
         """Test removing an order by ID successfully."""
         order = Order.objects.create(table_number=1, status=OrderStatus.STATUS_PENDING)
@@ -96,6 +208,20 @@ class OrderServiceTests(TestCase):
 
         self.assertEqual(updated_order.status, OrderStatus.STATUS_READY)
 
+    def test_set_status_by_id(self):
+        """Test setting an order's status with a single query."""
+        order = Order.objects.create(table_number=1, status=OrderStatus.STATUS_PENDING)
+        with self.assertNumQueries(1):
+            OrderService.set_status_by_id(order.id, OrderStatus.STATUS_READY)
+
+        order.refresh_from_db()
+        self.assertEqual(order.status, OrderStatus.STATUS_READY)
+
+        with self.assertRaises(SearchError):
+            OrderService.set_status_by_id(999, OrderStatus.STATUS_READY)
+        with self.assertRaises(ConstraintError):
+            OrderService.set_status_by_id(order.id, "invalid_status")
+
     def test_modify_status_by_id_invalid_status(self):
         """Test modifying an order's status with an invalid status."""
         order = Order.objects.create(table_number=1, status=OrderStatus.STATUS_PENDING)
@@ -107,20 +233,28 @@ class OrderServiceTests(TestCase):
 
     def test_modify_dishes_by_id_success(self):
         """Test modifying an order's dishes successfully."""
-        dish1 = Dish.objects.get(id=1)
-        dish2 = Dish.objects.get(id=2)
         order = Order.objects.create(table_number=1, status=OrderStatus.STATUS_PENDING)
 
         updated_order = OrderService.modify_dishes_by_id(
             order.id,
-            [{"dish_id": dish1.id, "quantity": 2}, {"dish_id": dish2.id}],
+            [{"dish_id": self.dish1.id, "quantity": 2}, {"dish_id": self.dish2.id}],
         )
 
-        self.assertEqual(
-            updated_order.total_price,
-            Decimal("31.97"),
-        )
-        self.assertEqual(updated_order.order_dishes.count(), 2)
+        self._assert_order(updated_order.id, dishes=2, price=Decimal("31.97"))
+
+    def test_modify_dishes_by_id_query_count_does_not_grow_with_dishes(self):
+        """Test that updating dishes costs the same number of queries for any dish count."""
+        order = OrderService.create(table_number=1, dishes=[{"dish_id": 1}])
+        query_counts = []
+        for dishes in (
+            [{"dish_id": 1}],
+            [{"dish_id": 1}, {"dish_id": 2}, {"dish_id": 3}],
+        ):
+            with CaptureQueriesContext(connection) as queries:
+                OrderService.modify_dishes_by_id(order.id, dishes)
+            query_counts.append(len(queries))
+
+        self.assertEqual(query_counts[0], query_counts[1])
 
     def test_modify_dishes_by_id_invalid_dish(self):
         """Test modifying an order's dishes with an invalid dish ID."""
@@ -133,23 +267,25 @@ class OrderServiceTests(TestCase):
 
     def test_calculate_profit_success(self):
         """Test calculating total profit from paid orders."""
-        dish1 = Dish.objects.get(id=1)
-        dish2 = Dish.objects.get(id=2)
-
-        order1 = Order.objects.create(
-            table_number=1,
-            status=OrderStatus.STATUS_PAID,
-            total_price=Decimal("10.99"),
+        order1, order2 = _make_orders(
+            {
+                "table_number": 1,
+                "status": OrderStatus.STATUS_PAID,
+                "total_price": Decimal("10.99"),
+            },
+            {
+                "table_number": 2,
+                "status": OrderStatus.STATUS_PAID,
+                "total_price": Decimal("17.98"),
+            },
         )
-        OrderDish.objects.create(order=order1, dish=dish1, quantity=1)
-
-        order2 = Order.objects.create(
-            table_number=2,
-            status=OrderStatus.STATUS_PAID,
-            total_price=Decimal("17.98"),
+        OrderDish.objects.bulk_create(
+            [
+                OrderDish(order=order1, dish=self.dish1, quantity=1),
+                OrderDish(order=order2, dish=self.dish1, quantity=1),
+                OrderDish(order=order2, dish=self.dish2, quantity=1),
+            ]
         )
-        OrderDish.objects.create(order=order2, dish=dish1, quantity=1)
-        OrderDish.objects.create(order=order2, dish=dish2, quantity=1)
 
         profit = OrderService.calculate_profit()
         self.assertEqual(profit, Decimal("28.97"))
@@ -167,11 +303,9 @@ class OrderServiceTests(TestCase):
         3. Verify that the original dishes remain unchanged.
         """
         # * Step 1: Create an order with valid dishes
-        dish1 = Dish.objects.get(id=1)
-        dish2 = Dish.objects.get(id=2)
         order = OrderService.create(
             table_number=1,
-            dishes=[{"dish_id": dish1.id}, {"dish_id": dish2.id}],
+            dishes=[{"dish_id": self.dish1.id}, {"dish_id": self.dish2.id}],
         )
         self.assertEqual(order.order_dishes.count(), 2)
 
@@ -181,9 +315,7 @@ class OrderServiceTests(TestCase):
         self.assertIn("Dish validation failed: dish id", str(context.exception))
 
         # * Step 3: Verify that the original dishes remain unchanged
-        order.refresh_from_db()
-        self.assertEqual(order.order_dishes.count(), 2)
-        self.assertEqual(order.total_price, Decimal("21.98"))
+        self._assert_order(order.id, dishes=2, price=Decimal("21.98"))
 
     def test_messing_up_transaction_based_logic(self):
         """
@@ -202,11 +334,9 @@ class OrderServiceTests(TestCase):
         self.assertEqual(Order.objects.count(), 0)
 
         # * Step 2: Create an order with valid dishes (should succeed)
-        dish1 = Dish.objects.get(id=1)
-        dish2 = Dish.objects.get(id=2)
         order = OrderService.create(
             table_number=1,
-            dishes=[{"dish_id": dish1.id}, {"dish_id": dish2.id}],
+            dishes=[{"dish_id": self.dish1.id}, {"dish_id": self.dish2.id}],
         )
         self.assertEqual(order.order_dishes.count(), 2)
 
@@ -216,9 +346,7 @@ class OrderServiceTests(TestCase):
         self.assertIn("Dish validation failed: dish id", str(context.exception))
 
         # * Step 4: Verify that the order remains unchanged after failed updates
-        order.refresh_from_db()
-        self.assertEqual(order.order_dishes.count(), 2)
-        self.assertEqual(order.total_price, Decimal("21.98"))
+        self._assert_order(order.id, dishes=2, price=Decimal("21.98"))
 
     def test_everything_goes_wrong_but_still_works_fine(self):
         """
@@ -239,11 +367,9 @@ class OrderServiceTests(TestCase):
         self.assertIn("Bad table_number", str(context.exception))
 
         # * Step 2: Create an order with valid data (should succeed)
-        dish1 = Dish.objects.get(id=1)
-        dish2 = Dish.objects.get(id=2)
         order = OrderService.create(
             table_number=1,
-            dishes=[{"dish_id": dish1.id}, {"dish_id": dish2.id}],
+            dishes=[{"dish_id": self.dish1.id}, {"dish_id": self.dish2.id}],
         )
         self.assertEqual(order.table_number, 1)
         self.assertEqual(order.status, OrderStatus.STATUS_PENDING)
@@ -257,10 +383,9 @@ class OrderServiceTests(TestCase):
         # * Step 4: Update the order with valid dishes (should succeed)
         updated_order = OrderService.modify_dishes_by_id(
             order.id,
-            [{"dish_id": dish1.id, "quantity": 2}, {"dish_id": dish2.id}],
+            [{"dish_id": self.dish1.id, "quantity": 2}, {"dish_id": self.dish2.id}],
         )
-        self.assertEqual(updated_order.total_price, Decimal("31.97"))
-        self.assertEqual(updated_order.order_dishes.count(), 2)
+        self._assert_order(updated_order.id, dishes=2, price=Decimal("31.97"))
 
         # * Step 5: Update the order status to an invalid status (should fail)
         with self.assertRaises(ConstraintError) as context:
@@ -303,11 +428,9 @@ class OrderServiceTests(TestCase):
         7. Verify the revenue calculation after deletion.
         """
         # * Step 1: Create an order with valid dishes
-        dish1 = Dish.objects.get(id=1)  # Margherita Pizza (9.99)
-        dish2 = Dish.objects.get(id=2)  # Pepperoni Pizza (11.99)
         order = OrderService.create(
             table_number=1,
-            dishes=[{"dish_id": dish1.id}, {"dish_id": dish2.id}],
+            dishes=[{"dish_id": self.dish1.id}, {"dish_id": self.dish2.id}],
         )
         self.assertEqual(order.table_number, 1)
         self.assertEqual(order.status, OrderStatus.STATUS_PENDING)
@@ -318,14 +441,12 @@ class OrderServiceTests(TestCase):
         updated_order = OrderService.modify_dishes_by_id(
             order.id,
             [
-                {"dish_id": dish1.id, "quantity": 2},
-                {"dish_id": dish2.id},
+                {"dish_id": self.dish1.id, "quantity": 2},
+                {"dish_id": self.dish2.id},
             ],  # 2x Margherita, 1x Pepperoni
         )
-        self.assertEqual(
-            updated_order.total_price, Decimal("31.97")
-        )  # (9.99 * 2) + 12.99
-        self.assertEqual(updated_order.order_dishes.count(), 2)
+        # ? (9.99 * 2) + 11.99
+        self._assert_order(updated_order.id, dishes=2, price=Decimal("31.97"))
 
         # * Step 3: Update the order's status to "ready"
         updated_order = OrderService.modify_status_by_id(
@@ -341,7 +462,7 @@ class OrderServiceTests(TestCase):
 
         # * Step 5: Verify the revenue calculation
         profit = OrderService.calculate_profit()
-        self.assertAlmostEqual(profit, Decimal("31.97"))
+        self.assertEqual(profit, Decimal("31.97"))
 
         # * Step 6: Delete the order
         deleted_count = OrderService.remove_by_id(order.id)
@@ -352,4 +473,4 @@ class OrderServiceTests(TestCase):
 
         # * Step 7: Verify the revenue calculation after deletion
         profit = OrderService.calculate_profit()
-        self.assertAlmostEqual(profit, Decimal("0"))
+        self.assertEqual(profit, Decimal("0"))
@@ -8,6 +8,9 @@ from orders.models import OrderStatus
 from orders.services import (DishService, OrderService, OrderServiceError,
                              SearchError)
 
+# * TextChoices.choices builds a new list on every access
+_STATUS_CHOICES = tuple(OrderStatus.choices)
+
 
 def order_list(request):
     """
@@ -20,19 +23,20 @@ def order_list(request):
         HttpResponse: Rendered order list page with filtered orders and status choices.
     """
     filters = {
-        filter: request.GET.get(filter)
-        for filter in ["table_number", "status", "order_id"]
-        if request.GET.get(filter)
+        filter: value
+        for filter in ("table_number", "status", "order_id")
+        if (value := request.GET.get(filter))
     }
     # ? order_id <=> Order PK <=> "pk"
-    filters["pk"] = filters.pop("order_id", None)
+    if "order_id" in filters:
+        filters["pk"] = filters.pop("order_id")
     orders = OrderService.search_by_filters(
         apply_prefetch=True, normalized=True, **filters
     )
     return render(
         request,
         "order_list.html",
-        {"orders": orders, "statuses": OrderStatus.choices},
+        {"orders": orders, "statuses": _STATUS_CHOICES},
     )
 
 
@@ -51,11 +55,16 @@ def _process_dishes(request):
     """
     dish_ids = request.POST.getlist("dishes")
     quantities = request.POST.getlist("quantities")
-    dishes = [
-        {"dish_id": int(dish_id), "quantity": int(qty)}
-        for dish_id, qty in zip(dish_ids, quantities)
-        if qty.isdigit() and int(qty) > 0
-    ]
+    dishes = []
+    for dish_id, qty in zip(dish_ids, quantities):
+        # * Convert each value once; unparsable rows are skipped like empty quantities
+        try:
+            quantity = int(qty)
+            dish_id = int(dish_id)
+        except ValueError:
+            continue
+        if quantity > 0:
+            dishes.append({"dish_id": dish_id, "quantity": quantity})
     if not dishes:
         raise ValidationError("Выберите хотя бы одно блюдо с количеством больше 0")
     return dishes
@@ -176,7 +185,7 @@ def update_order_status(request, order_id):
     if request.method == "POST":
         try:
             new_status = request.POST.get("status")
-            OrderService.modify_status_by_id(order_id, new_status)
+            OrderService.set_status_by_id(order_id, new_status)
             messages.success(request, "Статус успешно обновлен!")
         except OrderServiceError as e:
             messages.error(request, f"Ошибка при обновлении статуса: {str(e)}")